@@ -6,9 +6,12 @@
 # Set PATH so launchd can find python
 export PATH="/usr/local/bin:/opt/homebrew/bin:/usr/bin:/bin:/usr/sbin:/sbin"
 
-# Export Pushover credentials for notifications
-export PUSHOVER_USER="u6swfpe91tfxz718f6dx91m1tikdi6"
-export PUSHOVER_TOKEN="a7zimuio4jfzpj7yw5cbq5av3bbau3"
+# Export Pushover credentials for notifications. Taken from the environment
+# if already set, otherwise read from the macOS login keychain. Store them once with:
+#   security add-generic-password -a "$USER" -s tennis-checker-pushover-user -w YOUR_USER_KEY
+#   security add-generic-password -a "$USER" -s tennis-checker-pushover-token -w YOUR_API_TOKEN
+export PUSHOVER_USER="${PUSHOVER_USER:-$(security find-generic-password -s tennis-checker-pushover-user -w 2>/dev/null)}"
+export PUSHOVER_TOKEN="${PUSHOVER_TOKEN:-$(security find-generic-password -s tennis-checker-pushover-token -w 2>/dev/null)}"
 
 # Set log file
 LOG_FILE="/tmp/tennis_check.log"
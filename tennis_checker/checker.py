@@ -1,13 +1,64 @@
 """Core availability checking logic."""
 
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
 
 import requests
 
 from .config import Config
 from .notifier import PushoverNotifier
-from .utils import expand_time_slots, format_date, get_new_slots, parse_availability
+from .utils import (
+    REQUEST_TIMEOUT,
+    create_session,
+    expand_time_slots,
+    format_date,
+    get_new_slots,
+    index_days,
+    json_loads,
+    parse_availability,
+    split_by_date,
+)
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on concurrent venue requests
+MAX_WORKERS = 16
+
+
+# Notification message fragments
+_MESSAGE_HEADER = "{prefix} on {date}:\n"
+_VENUE_PREFIX = "\n📍 "
+_BULLET = "\n  • "
+
+
+def _message_lines(
+    prefix: str, formatted_date: str, availability_by_venue: Dict[str, List[str]]
+) -> Iterator[str]:
+    """Yield notification message blocks: the header, then one per venue."""
+    yield _MESSAGE_HEADER.format(prefix=prefix, date=formatted_date)
+    for venue_name, slots in availability_by_venue.items():
+        block = _VENUE_PREFIX + venue_name + ":"
+        if slots:
+            block += _BULLET + _BULLET.join(slots)
+        yield block
+
+
+def _venue_header(venue_name: str) -> List[str]:
+    """Output lines that introduce a venue's report."""
+    return [f"\n{'=' * 60}", f"Checking {venue_name}...", "=" * 60]
+
+
+class _Fetched(NamedTuple):
+    """Outcome of fetching one venue's session data."""
+
+    data: Optional[Dict] = None
+    error: Optional[Exception] = None
+    # HTTP validators for conditional requests: {"url", "etag", "last_modified"}
+    cache: Optional[Dict] = None
+    # True when the server answered 304 Not Modified for the cached validators
+    not_modified: bool = False
 
 
 class AvailabilityChecker:
@@ -18,6 +69,7 @@ class AvailabilityChecker:
         config: Config,
         notifier: Optional[PushoverNotifier] = None,
         notify_only_on_changes: bool = True,
+        session: Optional[requests.Session] = None,
     ):
         """
         Initialize availability checker.
@@ -26,10 +78,15 @@ class AvailabilityChecker:
             config: Configuration manager
             notifier: Notification handler (optional)
             notify_only_on_changes: Only send notifications for new availability
+            session: HTTP session shared across venue requests (optional)
         """
         self.config = config
         self.notifier = notifier
         self.notify_only_on_changes = notify_only_on_changes
+        self.session = session if session is not None else create_session(MAX_WORKERS)
+        # Worker pool for venue requests, created on first use and kept for
+        # the checker's lifetime (e.g. across checks in daemon mode)
+        self._executor: Optional[ThreadPoolExecutor] = None
 
     def check_venue(self, venue: Dict, date: str) -> List[str]:
         """
@@ -42,19 +99,92 @@ class AvailabilityChecker:
         Returns:
             List of availability strings (e.g., "Court 1: 7am-8am")
         """
-        venue_name = venue["name"]
-        url = venue["url_template"].format(date=date)
+        fetched = self._fetch_venue(venue, date)
+        return self._parse_venue(venue, date, fetched.data, fetched.error)
+
+    def _fetch_venue(
+        self,
+        venue: Dict,
+        date: str,
+        end_date: Optional[str] = None,
+        cache: Optional[Dict] = None,
+    ) -> _Fetched:
+        """
+        Fetch raw session data for a venue.
+
+        Safe to run in a worker thread: errors are returned rather than
+        raised so one failing venue doesn't affect the others.
 
-        print(f"\n{'=' * 60}")
-        print(f"Checking {venue_name}...")
-        print(f"{'=' * 60}")
+        Args:
+            venue: Venue configuration dictionary
+            date: Date to check (YYYY-MM-DD format), or start of the range
+            end_date: End of the range (YYYY-MM-DD format). Requires the venue
+                      to define `url_template_range`.
+            cache: HTTP validators saved from a previous response. If they
+                   belong to the same URL, the request is made conditional.
+
+        Returns:
+            Fetch outcome with the response data, or the error on failure
+        """
+        if end_date is None:
+            url = venue["url_template"].format(date=date)
+        else:
+            url = venue["url_template_range"].format(start=date, end=end_date)
+
+        headers = {}
+        if cache and cache.get("url") == url:
+            if cache.get("etag"):
+                headers["If-None-Match"] = cache["etag"]
+            if cache.get("last_modified"):
+                headers["If-Modified-Since"] = cache["last_modified"]
 
         try:
-            r = requests.get(url)
+            r = self.session.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+
+            if r.status_code == 304 and headers:
+                return _Fetched(cache=cache, not_modified=True)
+
             r.raise_for_status()
-            data = r.json()
+
+            new_cache = None
+            if r.headers.get("ETag") or r.headers.get("Last-Modified"):
+                new_cache = {
+                    "url": url,
+                    "etag": r.headers.get("ETag"),
+                    "last_modified": r.headers.get("Last-Modified"),
+                }
+
+            return _Fetched(data=json_loads(r.content), cache=new_cache)
         except Exception as e:
-            print(f"Error fetching data for {venue_name}: {e}")
+            return _Fetched(error=e)
+
+    def _parse_venue(
+        self,
+        venue: Dict,
+        date: str,
+        data: Optional[Dict],
+        error: Optional[Exception] = None,
+    ) -> List[str]:
+        """
+        Report and parse fetched session data for a venue.
+
+        Args:
+            venue: Venue configuration dictionary
+            date: Date to check (YYYY-MM-DD format)
+            data: Response data from _fetch_venue (None on failure)
+            error: Error raised while fetching, if any
+
+        Returns:
+            List of availability strings (e.g., "Court 1: 7am-8am")
+        """
+        venue_name = venue["name"]
+
+        # Collect this venue's report and write it in one go
+        output = _venue_header(venue_name)
+
+        if error is not None:
+            output.append(f"Error fetching data for {venue_name}: {error}")
+            logger.info("\n".join(output))
             return []
 
         earliest = data.get("EarliestStartTime", 420)
@@ -65,28 +195,48 @@ class AvailabilityChecker:
 
         for resource in data.get("Resources", []):
             court_name = resource["Name"]
-            day = next(
-                (d for d in resource["Days"] if d["Date"].startswith(date)), None
-            )
+            day = index_days(resource).get(date)
             if not day:
-                print(f"{court_name}: No data for {date}")
+                output.append(f"{court_name}: No data for {date}")
                 continue
 
             slots = parse_availability(resource, day, earliest, latest, min_interval)
 
             if not slots:
-                print(f"{court_name}: No availability")
+                output.append(f"{court_name}: No availability")
             else:
                 # Expand time slots to show individual hour start times
                 hour_starts = expand_time_slots(slots)
                 result = f"{court_name}: {', '.join(hour_starts)}"
-                print(result)
+                output.append(result)
                 venue_availability.append(result)
 
+        logger.info("\n".join(output))
         return venue_availability
 
+    def _report_unchanged(self, venue: Dict, availability: List[str]) -> List[str]:
+        """
+        Report a venue whose data hasn't changed since the last check.
+
+        Args:
+            venue: Venue configuration dictionary
+            availability: Availability saved from the last check
+
+        Returns:
+            The saved availability list
+        """
+        output = _venue_header(venue["name"])
+        output.append("(not modified since last check)")
+        output.extend(availability)
+        logger.info("\n".join(output))
+
+        return list(availability)
+
     def check_all_venues(
-        self, date: str, enabled_venue_ids: Optional[List[str]] = None
+        self,
+        date: str,
+        enabled_venue_ids: Optional[List[str]] = None,
+        now: Optional[datetime] = None,
     ) -> Dict:
         """
         Check availability for all enabled venues.
@@ -94,30 +244,208 @@ class AvailabilityChecker:
         Args:
             date: Date to check (YYYY-MM-DD format)
             enabled_venue_ids: List of venue IDs to check (None = all enabled)
+            now: Start time of the run, saved as `last_checked` (defaults to
+                 the current time)
 
         Returns:
             Dictionary with venue results and notification status
         """
+        # Read the clock before fetching, as check_all_dates does
+        checked_at = (now or datetime.now()).isoformat()
+
         venues = self.config.get_enabled_venues(enabled_venue_ids)
 
         if not venues:
-            print("No venues enabled. Please check venues.json")
+            logger.info("No venues enabled. Please check venues.json")
             return {"venues": {}, "notified": False}
 
         # Load previous state for this date (supports per-date state files)
         previous_state = self.config.load_state(date)
 
+        fetched = self._fetch_all(venues, [date], {date: previous_state})
+        return self._check_date(date, venues, fetched[date], previous_state, checked_at)
+
+    def check_all_dates(
+        self,
+        dates: List[str],
+        enabled_venue_ids: Optional[List[str]] = None,
+        now: Optional[datetime] = None,
+    ) -> Dict[str, Dict]:
+        """
+        Check availability for all enabled venues across several dates.
+
+        Venues that define `url_template_range` are fetched once for the
+        whole date range and the response is split by date in memory;
+        other venues are fetched once per date.
+
+        Args:
+            dates: Dates to check (YYYY-MM-DD format)
+            enabled_venue_ids: List of venue IDs to check (None = all enabled)
+            now: Start time of the run, saved as `last_checked` (defaults to
+                 the current time)
+
+        Returns:
+            Dictionary of date -> check_all_venues() result for that date
+        """
+        # One timestamp for the whole run, so every date's state agrees
+        checked_at = (now or datetime.now()).isoformat()
+
+        dates = list(dict.fromkeys(dates))
+        venues = self.config.get_enabled_venues(enabled_venue_ids)
+
+        if not venues:
+            logger.info("No venues enabled. Please check venues.json")
+            return {date: {"venues": {}, "notified": False} for date in dates}
+
+        # Load previous state for each date (supports per-date state files)
+        previous_states = {date: self.config.load_state(date) for date in dates}
+
+        fetched = self._fetch_all(venues, dates, previous_states)
+
+        results = {}
+        for date in dates:
+            logger.info(f"Checking availability for {format_date(date)}...")
+            results[date] = self._check_date(
+                date, venues, fetched[date], previous_states[date], checked_at
+            )
+
+        return results
+
+    def _fetch_all(
+        self, venues: List[Dict], dates: List[str], previous_states: Dict[str, Dict]
+    ) -> Dict[str, List[_Fetched]]:
+        """
+        Fetch session data for every venue and date concurrently.
+
+        Args:
+            venues: Venue configuration dictionaries
+            dates: Unique dates to fetch (YYYY-MM-DD format)
+            previous_states: Dictionary of date -> previously saved state
+
+        Returns:
+            Dictionary of date -> fetch outcomes, in venue order
+        """
+        start, end = min(dates), max(dates)
+
+        # One request per venue when it supports date ranges, else one per date
+        jobs = []
+        for venue in venues:
+            if start != end and venue.get("url_template_range"):
+                cache = self._cached_validators(venue, dates, previous_states)
+                jobs.append((venue, start, end, cache))
+            else:
+                for date in dates:
+                    cache = self._cached_validators(venue, [date], previous_states)
+                    jobs.append((venue, date, None, cache))
+
+        def fetch(job: Tuple) -> Dict[str, _Fetched]:
+            # Runs in a worker: splitting a ranged response by date happens
+            # here too, overlapping with requests that are still in flight
+            venue, date, end_date, cache = job
+            response = self._fetch_venue(venue, date, end_date, cache)
+            if end_date is None:
+                return {date: response}
+            if response.data is None:
+                return {d: response for d in dates}
+            return {
+                d: response._replace(data=data)
+                for d, data in split_by_date(response.data, dates).items()
+            }
+
+        # The work is network-bound, so fetching concurrently makes the total
+        # wait the slowest request rather than the sum of all of them
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+
+        fetched = {date: [] for date in dates}
+        for responses in self._executor.map(fetch, jobs):
+            for d, response in responses.items():
+                fetched[d].append(response)
+
+        return fetched
+
+    def _cached_validators(
+        self, venue: Dict, dates: List[str], previous_states: Dict[str, Dict]
+    ) -> Optional[Dict]:
+        """
+        Get the HTTP validators saved for a venue request covering some dates.
+
+        Validators are only usable if every covered date's state recorded the
+        same ones (i.e. they all came from the same response), since a 304
+        reuses each date's saved availability.
+
+        Args:
+            venue: Venue configuration dictionary
+            dates: Dates the request covers (YYYY-MM-DD format)
+            previous_states: Dictionary of date -> previously saved state
+
+        Returns:
+            Validators dictionary, or None if there is nothing usable
+        """
+        # State (and so the saved availability) is only kept when tracking changes
+        if not self.notify_only_on_changes:
+            return None
+
+        caches = [
+            previous_states[date].get(venue["id"], {}).get("cache") for date in dates
+        ]
+        if caches[0] and all(cache == caches[0] for cache in caches):
+            return caches[0]
+        return None
+
+    def _check_date(
+        self,
+        date: str,
+        venues: List[Dict],
+        fetched: List[_Fetched],
+        previous_state: Dict,
+        checked_at: str,
+    ) -> Dict:
+        """
+        Report, diff, and notify on fetched venue data for a single date.
+
+        Args:
+            date: Date being checked (YYYY-MM-DD format)
+            venues: Venue configuration dictionaries
+            fetched: Fetch outcome for each venue, in venue order
+            previous_state: Previously saved state for this date
+            checked_at: ISO timestamp of the run, saved as `last_checked`
+
+        Returns:
+            Dictionary with venue results and notification status
+        """
         # Track results across all venues
         all_results = {}
         new_availability_by_venue = {}
         total_new_slots = 0
+        venue_state = {}
 
-        # Check each venue
-        for venue in venues:
+        # Check each venue (in config order, so output is deterministic)
+        for venue, response in zip(venues, fetched):
             venue_id = venue["id"]
             venue_name = venue["name"]
 
-            current_availability = self.check_venue(venue, date)
+            if response.not_modified:
+                # Unchanged since last check: reuse the saved availability
+                current_availability = self._report_unchanged(
+                    venue, previous_state.get(venue_id, {}).get("availability", [])
+                )
+            else:
+                current_availability = self._parse_venue(
+                    venue, date, response.data, response.error
+                )
+
+            # State to save for this venue. A failed fetch says nothing about
+            # availability, so keep what was known rather than recording it
+            # as empty (which would re-notify every slot once it recovers).
+            if response.error is not None and venue_id in previous_state:
+                venue_state[venue_id] = previous_state[venue_id]
+            else:
+                venue_state[venue_id] = {
+                    "name": venue_name,
+                    "availability": current_availability,
+                    "cache": response.cache,
+                }
 
             # Store current results
             all_results[venue_id] = {
@@ -127,10 +455,22 @@ class AvailabilityChecker:
 
             # Compare with previous state if tracking changes
             if self.notify_only_on_changes:
-                previous_availability = previous_state.get(venue_id, {}).get(
-                    "availability", []
-                )
-                new_slots = get_new_slots(current_availability, previous_availability)
+                if response.error is not None:
+                    logger.info(
+                        f"\n⚠ Could not check {venue_name}; keeping previous state"
+                    )
+                    continue
+
+                if response.not_modified:
+                    # Same availability as last time by definition: nothing new
+                    new_slots = []
+                else:
+                    previous_availability = previous_state.get(venue_id, {}).get(
+                        "availability", []
+                    )
+                    new_slots = get_new_slots(
+                        current_availability, previous_availability
+                    )
 
                 if new_slots:
                     new_availability_by_venue[venue_name] = new_slots
@@ -138,41 +478,41 @@ class AvailabilityChecker:
 
                 if current_availability:
                     if new_slots:
-                        print(
+                        logger.info(
                             f"\n🎾 {len(new_slots)} new slot(s) detected at {venue_name}"
                         )
                     else:
-                        print(f"\n✓ All slots at {venue_name} were already known")
+                        logger.info(f"\n✓ All slots at {venue_name} were already known")
                 else:
-                    print(f"\n✗ No availability at {venue_name}")
+                    logger.info(f"\n✗ No availability at {venue_name}")
 
         # Print summary
-        print(f"\n{'=' * 60}")
-        print("SUMMARY")
-        print(f"{'=' * 60}")
+        logger.info("\n".join((f"\n{'=' * 60}", "SUMMARY", "=" * 60)))
 
         # Send notification based on mode
         notified = False
         if self.notify_only_on_changes:
             if new_availability_by_venue:
-                print(f"\n🎾 {total_new_slots} total new slot(s) across all venues!")
+                logger.info(
+                    f"\n🎾 {total_new_slots} total new slot(s) across all venues!"
+                )
                 notified = self._send_notification(
                     date, new_availability_by_venue, "New courts available"
                 )
             else:
                 total_slots = sum(len(v["availability"]) for v in all_results.values())
                 if total_slots > 0:
-                    print(
+                    logger.info(
                         f"✓ {total_slots} slot(s) found, but all were already known (no notification sent)"
                     )
                 else:
-                    print("✗ No availability found at any venue")
+                    logger.info("✗ No availability found at any venue")
         else:
             # Original behavior: notify whenever there's ANY availability
             total_slots = sum(len(v["availability"]) for v in all_results.values())
 
             if total_slots > 0:
-                print(f"🎾 {total_slots} slot(s) available across all venues")
+                logger.info(f"🎾 {total_slots} slot(s) available across all venues")
                 notified = self._send_notification(
                     date,
                     {
@@ -183,25 +523,24 @@ class AvailabilityChecker:
                     "Courts available",
                 )
             else:
-                print("✗ No availability found at any venue")
+                logger.info("✗ No availability found at any venue")
 
         # Save current state for next run (only if tracking changes)
         if self.notify_only_on_changes:
-            # Save state scoped to this date so multiple independent date checks
-            # won't overwrite each other.
-            self.config.save_state(
-                {
-                    **{
-                        venue_id: {
-                            "name": data["name"],
-                            "availability": data["availability"],
-                        }
-                        for venue_id, data in all_results.items()
-                    },
-                    "last_checked": datetime.now().isoformat(),
-                },
-                date,
-            )
+            previous_venue_state = {
+                key: value
+                for key, value in previous_state.items()
+                if key != "last_checked"
+            }
+
+            # Nothing changed since the last run: skip rewriting the file
+            if venue_state != previous_venue_state:
+                # Save state scoped to this date so multiple independent date
+                # checks won't overwrite each other.
+                self.config.save_state(
+                    {**venue_state, "last_checked": checked_at},
+                    date,
+                )
 
         return {
             "venues": all_results,
@@ -225,17 +564,15 @@ class AvailabilityChecker:
         Returns:
             True if notification was sent successfully
         """
-        if not self.notifier:
+        # Nothing to send without a notifier or without any slots to report
+        if not self.notifier or not availability_by_venue:
             return False
 
         # Format date for notification
         formatted_date = format_date(date)
 
         # Build notification message grouped by venue
-        message_parts = [f"{prefix} on {formatted_date}:\n"]
-        for venue_name, slots in availability_by_venue.items():
-            message_parts.append(f"\n📍 {venue_name}:")
-            message_parts.extend([f"  • {slot}" for slot in slots])
-
-        message = "\n".join(message_parts)
+        message = "\n".join(
+            _message_lines(prefix, formatted_date, availability_by_venue)
+        )
         return self.notifier.send(message, "Tennis Courts Available")
@@ -0,0 +1,179 @@
+"""
+Command-line interface for tennis court availability checker.
+
+Usage:
+    tennis-checker
+    tennis-checker --daemon --interval 300
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+# Named explicitly so `python -m tennis_checker.cli` (where __name__ is
+# "__main__") still logs through the package handler set up in main()
+logger = logging.getLogger("tennis_checker.cli")
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for an integer of at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def _dates_to_check(dates: Optional[List[str]], run_start: datetime) -> List[str]:
+    """Dates given on the command line, or the day the check started."""
+    return dates or [run_start.strftime("%Y-%m-%d")]
+
+
+def _run_check(checker, args) -> Dict[str, Dict]:
+    """Run one check, reading the clock once for the default date and `last_checked`."""
+    run_start = datetime.now()
+    return checker.check_all_dates(
+        _dates_to_check(args.date, run_start),
+        enabled_venue_ids=args.venues,
+        now=run_start,
+    )
+
+
+def main():
+    """Main CLI entry point."""
+    parser = argparse.ArgumentParser(
+        description="Check tennis court availability across multiple venues"
+    )
+    parser.add_argument(
+        "--date",
+        type=str,
+        nargs="+",
+        default=None,
+        help="Date(s) to check (YYYY-MM-DD format). Can specify multiple dates. Defaults to today.",
+    )
+    parser.add_argument(
+        "--venues",
+        type=str,
+        nargs="+",
+        default=None,
+        help="Venue IDs to check. If not specified, checks all enabled venues.",
+    )
+    parser.add_argument(
+        "--notify-always",
+        action="store_true",
+        help="Always send notifications when courts are available (not just for new slots)",
+    )
+    parser.add_argument(
+        "--pushover-user",
+        type=str,
+        default=None,
+        help="Pushover user key (can also be set via PUSHOVER_USER environment variable)",
+    )
+    parser.add_argument(
+        "--pushover-token",
+        type=str,
+        default=None,
+        help="Pushover API token (can also be set via PUSHOVER_TOKEN environment variable)",
+    )
+    parser.add_argument(
+        "--no-notify",
+        action="store_true",
+        help="Disable notifications (just print results)",
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Keep running and re-check every --interval seconds, reusing connections and config",
+    )
+    parser.add_argument(
+        "--interval",
+        type=_positive_int,
+        default=60,
+        help="Seconds between checks in --daemon mode (default: 60)",
+    )
+
+    args = parser.parse_args()
+
+    # Checker output goes through logging; show it on stdout as plain lines.
+    # Only attach the handler once, so repeated main() calls don't duplicate output.
+    package_logger = logging.getLogger("tennis_checker")
+    if not package_logger.handlers:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        package_logger.addHandler(handler)
+    package_logger.setLevel(logging.INFO)
+
+    # Imported after argument parsing so `--help` doesn't pay for loading
+    # requests and the rest of the package
+    from .checker import AvailabilityChecker
+    from .config import Config
+    from .notifier import PushoverNotifier
+    from .utils import create_session
+
+    # Initialize configuration
+    config = Config()
+
+    # One HTTP session for venue checks and notifications, so every request
+    # in the run shares the same connection pool
+    session = create_session()
+
+    # Initialize notifier (if enabled). Credentials are only resolved from the
+    # environment when notifications are actually wanted.
+    notifier = None
+    if not args.no_notify:
+        pushover_user = args.pushover_user or os.environ.get("PUSHOVER_USER")
+        pushover_token = args.pushover_token or os.environ.get("PUSHOVER_TOKEN")
+        if pushover_user and pushover_token:
+            notifier = PushoverNotifier(pushover_user, pushover_token, session=session)
+
+    # Initialize checker
+    checker = AvailabilityChecker(
+        config=config,
+        notifier=notifier,
+        notify_only_on_changes=not args.notify_always,
+        session=session,
+    )
+
+    # Daemon mode: one long-lived process keeps the HTTP session, parsed
+    # config, and notifier between checks instead of paying startup each time
+    if args.daemon:
+        try:
+            while True:
+                # A failed check shouldn't take down the long-lived process;
+                # log it and try again after the usual interval
+                try:
+                    _run_check(checker, args)
+                except Exception:
+                    logger.exception("Check failed")
+                time.sleep(args.interval)
+        except KeyboardInterrupt:
+            logger.info("\nStopped.")
+            return 0
+
+    # Check availability for each date
+    any_notified = False
+    any_available = False
+
+    results = _run_check(checker, args)
+
+    for result in results.values():
+        if result["notified"]:
+            any_notified = True
+        if any(v["availability"] for v in result["venues"].values()):
+            any_available = True
+
+    # Exit with appropriate code
+    if any_notified or any_available:
+        return 0
+    else:
+        return 1
+
+
+if __name__ == "__main__":
+    exit(main())
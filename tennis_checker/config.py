@@ -1,8 +1,56 @@
 """Configuration management for tennis checker."""
 
-import json
+import os
+import secrets
+import stat
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+from .utils import json_dumps, json_loads
+
+
+def _create_temp_file(path: Path) -> Tuple[int, str]:
+    """
+    Create a uniquely named temp file next to `path` for an atomic replace.
+
+    The file is created with the existing file's permission bits, or 0666
+    for a new one; the kernel applies the umask, so process state is never
+    touched (mkstemp would instead leave the file at 0600).
+
+    Returns:
+        Open file descriptor and the temp file's path
+    """
+    try:
+        mode = stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        mode = 0o666
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    while True:
+        tmp_name = str(path.with_name(f"{path.name}.{secrets.token_hex(8)}.tmp"))
+        try:
+            return os.open(tmp_name, flags, mode), tmp_name
+        except FileExistsError:
+            continue
+
+
+@lru_cache(maxsize=8)
+def _load_json_cached(path: str, mtime_ns: int) -> Any:
+    """
+    Load and parse a JSON file, memoized on its modification time.
+
+    The mtime is part of the cache key, so editing the file invalidates
+    the cached copy automatically. Callers must not mutate the result.
+
+    Args:
+        path: Path to the JSON file
+        mtime_ns: File modification time in nanoseconds
+
+    Returns:
+        Parsed JSON data
+    """
+    with open(path, "rb") as f:
+        return json_loads(f.read())
 
 
 class Config:
@@ -34,9 +82,10 @@ class Config:
             return []
 
         try:
-            with open(self.venues_file, "r") as f:
-                data = json.load(f)
-                return data.get("venues", [])
+            data = _load_json_cached(
+                str(self.venues_file), self.venues_file.stat().st_mtime_ns
+            )
+            return data.get("venues", [])
         except Exception as e:
             print(f"Error loading venues: {e}")
             return []
@@ -81,8 +130,7 @@ class Config:
                 state_path = self.legacy_state_file
 
             if state_path.exists():
-                with open(state_path, "r") as f:
-                    return json.load(f)
+                return json_loads(state_path.read_bytes())
         except Exception as e:
             print(f"Warning: Could not load previous state: {e}")
 
@@ -108,7 +156,23 @@ class Config:
                 self.legacy_state_file.parent.mkdir(parents=True, exist_ok=True)
                 state_path = self.legacy_state_file
 
-            with open(state_path, "w") as f:
-                json.dump(state_data, f, indent=2)
+            # Write to a temp file and atomically swap it in, so an interrupted
+            # run never leaves a truncated state file behind. The temp name is
+            # unique so concurrent runs for the same date can't clobber it.
+            fd, tmp_name = _create_temp_file(state_path)
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(json_dumps(state_data))
+                    # Make sure the data is on disk before the rename
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_name, state_path)
+            except BaseException:
+                # Don't let a failed cleanup mask the original error
+                try:
+                    os.unlink(tmp_name)
+                except FileNotFoundError:
+                    pass
+                raise
         except Exception as e:
             print(f"Warning: Could not save state: {e}")
@@ -1,22 +1,38 @@
 """Notification handling for tennis checker."""
 
+from typing import Optional
+
 import requests
 
+from .utils import REQUEST_TIMEOUT, create_session
+
 
 class PushoverNotifier:
     """Send notifications via Pushover API."""
 
-    def __init__(self, user_key: str, api_token: str):
+    def __init__(
+        self,
+        user_key: str,
+        api_token: str,
+        session: Optional[requests.Session] = None,
+    ):
         """
         Initialize Pushover notifier.
 
         Args:
             user_key: Pushover user key
             api_token: Pushover API token
+            session: HTTP session to send requests through (optional)
         """
         self.user_key = user_key
         self.api_token = api_token
         self.api_url = "https://api.pushover.net/1/messages.json"
+        self.session = session if session is not None else create_session()
+
+        # Check credentials once up front; without them, sending is a no-op
+        if not self.user_key or not self.api_token:
+            print("Warning: Pushover credentials not set. Notifications disabled.")
+            self.send = self._send_disabled
 
     def send(self, message: str, title: str = "Tennis Court Availability") -> bool:
         """
@@ -29,12 +45,8 @@ class PushoverNotifier:
         Returns:
             True if successful, False otherwise
         """
-        if not self.user_key or not self.api_token:
-            print("Warning: Pushover credentials not set. Skipping notification.")
-            return False
-
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.api_url,
                 data={
                     "token": self.api_token,
@@ -42,6 +54,7 @@ class PushoverNotifier:
                     "message": message,
                     "title": title,
                 },
+                timeout=REQUEST_TIMEOUT,
             )
 
             if response.status_code == 200:
@@ -53,3 +66,9 @@ class PushoverNotifier:
         except Exception as e:
             print(f"Error sending Pushover notification: {e}")
             return False
+
+    def _send_disabled(
+        self, message: str, title: str = "Tennis Court Availability"
+    ) -> bool:
+        """Stand-in for send() when credentials are missing; always False."""
+        return False
@@ -1,9 +1,89 @@
 """Utility functions for tennis checker."""
 
+import json
 from datetime import datetime
-from typing import List, Tuple
+from functools import lru_cache
+from itertools import chain, starmap
+from typing import Any, Dict, Iterable, List, Tuple
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# (connect, read) timeout in seconds for all HTTP requests
+REQUEST_TIMEOUT = (3.05, 10)
+
+
+def json_loads(data: bytes) -> Any:
+    """
+    Parse JSON, using orjson when it is installed.
+
+    Args:
+        data: Raw JSON document
+
+    Returns:
+        Parsed JSON data
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any) -> bytes:
+    """
+    Serialize to compact JSON bytes, using orjson when it is installed.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        UTF-8 encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def create_session(pool_size: int = 16) -> requests.Session:
+    """
+    Create an HTTP session with connection pooling and retries.
+
+    Reusing one session keeps TCP/TLS connections alive across requests
+    instead of re-doing the handshake for every call.
+
+    Args:
+        pool_size: Connections kept per host; should cover the number of
+                   concurrent requests (all venues share the ClubSpark host)
+
+    Returns:
+        Configured requests session
+    """
+    session = requests.Session()
+    # Only idempotent GETs are retried on error statuses; a retried Pushover
+    # POST could deliver the same notification twice. Retry-After is ignored
+    # so a rate-limited response can't park a worker for hours; retries use
+    # the short backoff instead, keeping the check's worst case bounded.
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset({"GET"}),
+        respect_retry_after_header=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+@lru_cache(maxsize=64)
 def format_date(date_str: str) -> str:
     """
     Format date string to human-readable format.
@@ -17,14 +97,30 @@ def format_date(date_str: str) -> str:
     try:
         date_obj = datetime.strptime(date_str, "%Y-%m-%d")
         # Format as "Monday Oct. 20"
-        # Use .lstrip('0') to remove leading zeros for cross-platform compatibility
-        day = date_obj.strftime("%d").lstrip("0")
-        return f"{date_obj.strftime('%A')} {date_obj.strftime('%b')}. {day}"
+        # Use .day rather than %d so there's no leading zero on any platform
+        return f"{date_obj.strftime('%A %b')}. {date_obj.day}"
     except Exception:
         # Fallback to original if parsing fails
         return date_str
 
 
+def _format_hour(hours: int) -> str:
+    """Format an hour of the day (0-23) as a 12-hour label (e.g., "7am")."""
+    # Convert to 12-hour format
+    if hours == 0:
+        return "12am"
+    elif hours < 12:
+        return f"{hours}am"
+    elif hours == 12:
+        return "12pm"
+    else:
+        return f"{hours - 12}pm"
+
+
+# Label for every hour of the day, computed once at import
+_HOUR_LABELS = tuple(_format_hour(h) for h in range(24))
+
+
 def minutes_to_time(minutes: int) -> str:
     """
     Convert minutes from midnight to 12-hour format.
@@ -35,17 +131,13 @@ def minutes_to_time(minutes: int) -> str:
     Returns:
         Time in 12-hour format (e.g., "7am", "2pm")
     """
-    hours, _ = divmod(minutes, 60)
+    return _HOUR_LABELS[(minutes // 60) % 24]
 
-    # Convert to 12-hour format
-    if hours == 0:
-        return "12am"
-    elif hours < 12:
-        return f"{hours}am"
-    elif hours == 12:
-        return "12pm"
-    else:
-        return f"{hours - 12}pm"
+
+@lru_cache(maxsize=256)
+def _expand_slot(start: int, end: int) -> Tuple[str, ...]:
+    """Hour start labels within one slot; courts share a few slot shapes."""
+    return tuple(_HOUR_LABELS[(minute // 60) % 24] for minute in range(start, end, 60))
 
 
 def expand_time_slots(slots: List[Tuple[int, int]]) -> List[str]:
@@ -58,16 +150,46 @@ def expand_time_slots(slots: List[Tuple[int, int]]) -> List[str]:
     Returns:
         List of individual hour start times (e.g., ["2pm", "3pm", "5pm"])
     """
-    hour_starts = []
+    return list(chain.from_iterable(starmap(_expand_slot, slots)))
 
-    for start, end in slots:
-        # Generate all hour starts within this slot range
-        current = start
-        while current < end:
-            hour_starts.append(minutes_to_time(current))
-            current += 60  # Move to next hour
 
-    return hour_starts
+def index_days(resource: dict) -> Dict[str, dict]:
+    """
+    Index a resource's day entries by date.
+
+    Args:
+        resource: Resource (court) data from API
+
+    Returns:
+        Dictionary of YYYY-MM-DD date -> day data
+    """
+    return {day["Date"][:10]: day for day in resource.get("Days", [])}
+
+
+def split_by_date(data: dict, dates: Iterable[str]) -> Dict[str, dict]:
+    """
+    Split a multi-day venue response into single-day responses.
+
+    Args:
+        data: Venue response data from API covering a date range
+        dates: Dates to extract (YYYY-MM-DD format)
+
+    Returns:
+        Dictionary of date -> response data containing only that date
+    """
+    resources = data.get("Resources", [])
+    days_by_resource = [index_days(resource) for resource in resources]
+
+    return {
+        date: {
+            **data,
+            "Resources": [
+                {**resource, "Days": [days[date]] if date in days else []}
+                for resource, days in zip(resources, days_by_resource)
+            ],
+        }
+        for date in dates
+    }
 
 
 def parse_availability(
@@ -86,36 +208,36 @@ def parse_availability(
     Returns:
         List of (start_time, end_time) tuples in minutes since midnight
     """
-    sessions = day.get("Sessions", [])
-    availability = []
+    # Category 0 = Available for booking
+    # Must have Capacity >= 1 to be bookable
+    # (ClubSpark always sends these keys, so subscript rather than .get())
+    availability = [
+        (session["StartTime"], session["EndTime"])
+        for session in day.get("Sessions", [])
+        if session["Category"] == 0 and session["Capacity"] >= 1
+    ]
 
-    for session in sessions:
-        # Category 0 = Available for booking
-        # Must have Capacity >= 1 to be bookable
-        if session.get("Category") == 0 and session.get("Capacity", 0) >= 1:
-            availability.append((session["StartTime"], session["EndTime"]))
-
-    return sorted(availability, key=lambda x: x[0])
+    # Tuples compare by start time first, so no key function is needed; the
+    # API usually returns sessions in order, which makes this a linear pass
+    availability.sort()
+    return availability
 
 
 def get_new_slots(
-    current_availability: List[str], previous_availability: List[str]
+    current_availability: List[str], previous_availability: Iterable[str]
 ) -> List[str]:
     """
     Compare current and previous availability to find new slots.
 
     Args:
         current_availability: Current availability strings
-        previous_availability: Previous availability strings
+        previous_availability: Previous availability strings (list or set)
 
     Returns:
-        List of newly available slots
+        List of newly available slots, in current order
     """
-    new_slots = []
-
-    for court_result in current_availability:
-        # Check if this exact result was in the previous state
-        if court_result not in previous_availability:
-            new_slots.append(court_result)
+    # Hash lookups instead of scanning the previous list for every slot
+    if not isinstance(previous_availability, (set, frozenset)):
+        previous_availability = set(previous_availability)
 
-    return new_slots
+    return [r for r in current_availability if r not in previous_availability]